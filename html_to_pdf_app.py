@@ -0,0 +1,119 @@
+"""Tkinter front end for the HTML to PDF converter."""
+
+import os
+import queue
+import threading
+import tkinter as tk
+from pathlib import Path
+from tkinter import filedialog, messagebox, scrolledtext
+
+
+class HTMLToPDFApp:
+    """Simple one-window GUI around HTMLToPDFConverter."""
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title("HTML to PDF Converter")
+        self.root.geometry("560x420")
+        # Imported on first conversion so the window appears instantly.
+        self.converter = None
+        self.html_file_path = ""
+        self._log_q = queue.Queue()
+        self.root.after(50, self._drain_log_queue)
+
+        file_frame = tk.Frame(self.root)
+        file_frame.pack(fill=tk.X, padx=10, pady=10)
+        tk.Label(file_frame, text="HTML file:").pack(side=tk.LEFT)
+        self.file_entry = tk.Entry(file_frame)
+        self.file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        tk.Button(file_frame, text="Browse...",
+                  command=self.browse_html).pack(side=tk.LEFT)
+
+        tk.Button(self.root, text="Convert to PDF",
+                  command=self.convert_html_to_pdf).pack(pady=5)
+
+        tk.Label(self.root, text="Progress:").pack(anchor=tk.W, padx=10)
+        self.progress_text = scrolledtext.ScrolledText(self.root, height=14)
+        self.progress_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    def log(self, message):
+        """Queue a line for the progress box (safe from any thread)."""
+        self._log_q.put(message)
+
+    def log_many(self, messages):
+        """Queue several lines at once; the drain inserts a whole batch
+        into the Text widget as a single call."""
+        for message in messages:
+            self._log_q.put(message)
+
+    def _drain_log_queue(self):
+        """Move queued log lines into the progress box on the Tk thread.
+
+        All pending lines go in as one insert, and the widget only
+        repaints (update_idletasks, which skips user-event processing)
+        when something actually arrived.
+        """
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.progress_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.progress_text.see(tk.END)
+            self.root.update_idletasks()
+        self.root.after(50, self._drain_log_queue)
+
+    def browse_html(self):
+        filename = filedialog.askopenfilename(
+            title="Select HTML file",
+            filetypes=[("HTML files", "*.html *.htm"), ("All files", "*.*")])
+        if filename:
+            # normpath gives the platform's separators; the old
+            # "/" -> "\\" swap corrupted paths everywhere but Windows.
+            filename = os.path.normpath(filename)
+            self.html_file_path = filename
+            self.file_entry.delete(0, tk.END)
+            self.file_entry.insert(0, filename)
+
+    def convert_html_to_pdf(self):
+        if not self.html_file_path:
+            messagebox.showwarning("No file", "Please select an HTML file first.")
+            return
+        # Run the conversion off the Tk thread so the window stays
+        # responsive while pisa works.
+        threading.Thread(target=self._do_convert,
+                         args=(self.html_file_path,), daemon=True).start()
+
+    def _do_convert(self, html_file_path):
+        try:
+            if self.converter is None:
+                self.log("Loading conversion engine...")
+                from html_to_pdf_standalone import HTMLToPDFConverter
+                self.converter = HTMLToPDFConverter()
+            self.log("Reading HTML file...")
+            with open(html_file_path, 'r', encoding='utf-8') as f:
+                html_content = f.read()
+            self.log(f"Read {len(html_content)} characters")
+            output_path = str(Path(html_file_path).with_suffix(".pdf"))
+            self.log_many(["Sanitizing HTML...",
+                           "Converting to PDF (this can take a while)..."])
+            self.converter.create_pdf_from_html(html_content, output_path)
+            self.log_many([f"Saved: {output_path}", "Done."])
+            self.root.after(0, lambda: messagebox.showinfo(
+                "Success", f"PDF saved to:\n{output_path}"))
+        except Exception as e:
+            self.log(f"Error: {e}")
+            self.root.after(0, lambda e=e: messagebox.showerror(
+                "Conversion failed", str(e)))
+
+
+def main():
+    root = tk.Tk()
+    HTMLToPDFApp(root)
+    root.mainloop()
+
+
+if __name__ == '__main__':
+    main()
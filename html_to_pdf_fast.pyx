@@ -0,0 +1,57 @@
+# cython: language_level=3
+"""Optional compiled fast path for the converter's hot string loops.
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+html_to_pdf_standalone falls back to its pure-Python implementations
+when this extension has not been built.
+"""
+
+
+cpdef str strip_page_numbers(str html):
+    """Remove bare page-number fractions like '3/12' in one typed pass.
+
+    Equivalent to re.sub(r'\\b\\d+/\\d+\\b', '', html) but walks the
+    string once with C-level indexing instead of the regex engine.
+    """
+    cdef Py_ssize_t n = len(html)
+    cdef Py_ssize_t i = 0, j, k, start = 0
+    cdef list out = []
+    cdef Py_UCS4 ch
+    while i < n:
+        ch = html[i]
+        if '0' <= ch <= '9' and (i == 0 or not (html[i - 1].isalnum()
+                                                or html[i - 1] == '_')):
+            j = i
+            while j < n and '0' <= html[j] <= '9':
+                j += 1
+            if j < n and html[j] == '/':
+                k = j + 1
+                while k < n and '0' <= html[k] <= '9':
+                    k += 1
+                if k > j + 1 and (k == n or not (html[k].isalnum()
+                                                 or html[k] == '_')):
+                    out.append(html[start:i])
+                    start = k
+                    i = k
+                    continue
+            i = j
+            continue
+        i += 1
+    if start == 0:
+        return html
+    out.append(html[start:])
+    return "".join(out)
+
+
+cpdef str wrap_pages(list html_pages):
+    """Wrap each page fragment in its page-break div and join them."""
+    cdef list parts = []
+    cdef str page
+    for page in html_pages:
+        parts.append('<div class="page" style="page-break-after: always;">')
+        parts.append(page)
+        parts.append('</div>')
+    return "".join(parts)
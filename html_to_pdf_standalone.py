@@ -0,0 +1,711 @@
+"""Standalone HTML to PDF converter built on xhtml2pdf.
+
+Cleans up exported HTML (CSS values, page numbers, duplicate list
+markers) that xhtml2pdf cannot handle, wraps it in a printable
+document and renders it to PDF.
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import logging
+import mmap
+import os
+import re
+import sys
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+try:
+    # Compiled fast path (python setup.py build_ext --inplace).
+    from html_to_pdf_fast import strip_page_numbers as _strip_page_numbers
+    from html_to_pdf_fast import wrap_pages as _wrap_pages
+except ImportError:
+    _strip_page_numbers = None
+    _wrap_pages = None
+
+try:
+    # Structural cleanup is done on a parsed tree when lxml is
+    # available; libxml2 walks the document far faster than the
+    # equivalent regex passes and handles nested markup correctly.
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+logger = logging.getLogger(__name__)
+
+
+# Normalized values for the margin rules the exports get wrong.
+_MARGIN_DEFAULTS = {
+    'margin': 'margin:0;',
+    'margin-top': 'margin-top:6px;',
+    'margin-bottom': 'margin-bottom:6px;',
+}
+
+# Every independent sanitize substitution fused into one alternation so
+# a single pass over the HTML handles all of them.  Scoped inline flags
+# keep DOTALL/IGNORECASE local to the patterns that need them, and each
+# replacement is either a literal string or a callable dispatched per
+# named group.
+_SCAN_SUBS = [
+    # Inline stylesheets confuse xhtml2pdf's CSS parser; the wrapper
+    # document supplies its own.
+    ('style', r'(?si:<style[^>]*>.*?</style>)', ''),
+    # Empty paragraphs exported by word processors.
+    ('empty_p', r'<p>\s*</p>', ''),
+    ('nbsp_p', r'<p>\s*&nbsp;\s*</p>', ''),
+    # Page-number artifacts like "<p>3/12</p>" or "Page 3/12".
+    ('pagenum_p', r'<p>\s*\d+\s*/\s*\d+\s*</p>', ''),
+    ('page_label', r'(?i:Page\s+\d+\s*/\s*\d+)', ''),
+    ('page_frac', r'\b\d+/\d+\b', ''),
+    # Runs of <br> collapse to a single break.  Non-capturing: the
+    # engine skips backreference bookkeeping for the repeated group.
+    ('brs', r'(?:<br\s*/?>\s*){2,}', '<br>'),
+    # Collapse whitespace between tags.  The lookahead leaves the next
+    # '<' unconsumed so an adjacent match (e.g. a <br> run) still fires.
+    ('tag_ws', r'>\s+(?=<)', '>'),
+    # Normalize spacing the exports get wrong.  These come before the
+    # decimal strips in the alternation so "padding: 10.5px" is still
+    # recognized whole.
+    ('padding', r'padding:\s*\d+(?:\.\d+)?px;?', 'padding:6px;'),
+    ('margin',
+     r'(?P<margin_prop>margin(?:-top|-bottom)?):\s*\d+(?:\.\d+)?px;?',
+     lambda m: _MARGIN_DEFAULTS[m['margin_prop']]),
+    # xhtml2pdf chokes on fractional CSS units; round them down.
+    ('unit_dec', r'(?P<unit_int>\d+)\.\d+(?P<unit>px|pt|em|%)',
+     lambda m: m['unit_int'] + m['unit']),
+    # Leftover bare decimals (line-height etc.).  The lookarounds keep
+    # the strip away from legal references ("paragraph 1.1", "(4.1)",
+    # "3.1 of this agreement"), which used to require an encode/decode
+    # round-trip through protect/restore_legal_references.
+    ('bare_dec',
+     r'(?<!(?i:paragraph) )(?<!(?i:paragraphs) )(?<!(?i:article) )'
+     r'(?<!(?i:articles) )(?<!(?i:clause) )(?<!(?i:clauses) )'
+     r'(?<!(?i:section) )(?<!(?i:sections) )(?<!\()'
+     # (?!\d) keeps the fractional run atomic: without it the engine
+     # backtracks "3.15" to "3.1" to sneak past the of-this guard.
+     r'(?P<bare_int>\d+)\.\d+(?!\d)(?!\s+of\s+this\s)',
+     lambda m: m['bare_int']),
+]
+_SCAN_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern, _ in _SCAN_SUBS))
+_SCAN_HANDLERS = {name: repl for name, _, repl in _SCAN_SUBS}
+
+
+def _scan_repl(match: re.Match) -> str:
+    # groupdict preserves declaration order, so the first non-None
+    # entry is the top-level alternative that matched (nested helper
+    # groups are declared after their parent).
+    name = next(name for name, value in match.groupdict().items()
+                if value is not None)
+    handler = _SCAN_HANDLERS[name]
+    return handler(match) if callable(handler) else handler
+
+
+# List handling.
+_OL_TYPE_MAP = {
+    '1': 'decimal',
+    'a': 'lower-alpha',
+    'A': 'upper-alpha',
+    'i': 'lower-roman',
+    'I': 'upper-roman',
+}
+_OL_TYPE_RE = re.compile(r'<ol([^>]*?)type=["\']([^"\']+)["\']([^>]*)>')
+_INLINE_STYLE_RE = re.compile(r'style="([^"]*)"')
+# Explicit character classes instead of re.IGNORECASE: the flag makes
+# the engine case-fold every character at match time.
+_LIST_TAG_RE = re.compile(r'<(/?)(?:[uUoO][lL])\b')
+# Hand-typed markers ("1.", "2)", "a.", "b)", "(iv)", "ii.") stripped
+# from <li> items in one pass.
+_LI_MARKER_RE = re.compile(
+    r'<li>\s*(?:\d+[.)]|[A-Za-z][.)]|\([IVXLCDMivxlcdm]+\)'
+    r'|[IVXLCDMivxlcdm]+\.)\s+')
+# Same markers anchored to an item's leading text, for the lxml path.
+_LI_TEXT_MARKER_RE = re.compile(
+    r'^\s*(?:\d+[.)]|[A-Za-z][.)]|\([IVXLCDMivxlcdm]+\)'
+    r'|[IVXLCDMivxlcdm]+\.)\s+')
+
+# Table fixups (_fix_page).
+_SPAN_STRIP_RE = re.compile(r'\s*(?:col|row)span="[^"]*"')
+_TABLE_TAG_RE = re.compile(r'<(table|td|th)\b([^>]*)>')
+_TABLE_TAG_STYLES = {
+    'table': 'table-layout:fixed;width:100%;',
+    'td': 'width:auto;',
+    'th': 'width:auto;',
+}
+
+
+def _table_tag_repl(match: re.Match) -> str:
+    tag = match.group(1)
+    attrs = match.group(2)
+    injected = _TABLE_TAG_STYLES[tag]
+    if 'style=' in attrs:
+        # Merge into the existing attribute; html5lib drops duplicate
+        # style= attributes, keeping the first.
+        attrs = _INLINE_STYLE_RE.sub(
+            lambda m: f'style="{m.group(1)};{injected}"', attrs)
+        return f'<{tag}{attrs}>'
+    return f'<{tag}{attrs} style="{injected}">'
+
+
+# Static wrapper document emitted around the sanitized pages.  Built
+# once at import time instead of being re-rendered per conversion.
+_HTML_HEADER = """<html>
+<head>
+<meta charset="UTF-8">
+<style>
+    body {
+        font-family: 'Liberation Sans', Arial, sans-serif;
+        font-size: 11pt;
+        line-height: 1.4;
+        color: #000000;
+    }
+    h1 { font-size: 16pt; margin-top: 12pt; }
+    h2 { font-size: 14pt; margin-top: 10pt; }
+    h3 { font-size: 12pt; margin-top: 8pt; }
+    p { margin: 4pt 0; text-align: justify; }
+    table {
+        width: 100%;
+        border-collapse: collapse;
+        table-layout: fixed;
+    }
+    td, th {
+        border: 1pt solid #444444;
+        padding: 3pt;
+        vertical-align: top;
+    }
+    ol, ul { margin: 4pt 0 4pt 18pt; }
+    li { margin: 2pt 0; }
+    .page { page-break-after: always; }
+</style>
+</head>
+<body>
+"""
+
+_HTML_FOOTER = """
+</body>
+</html>"""
+
+# Per-page wrapper emitted around each page fragment.
+_PAGE_OPEN = '<div class="page" style="page-break-after: always;">'
+_PAGE_CLOSE = '</div>'
+
+# Interned once so reuse across many conversions shares one string
+# object and cached hash instead of churning the pool.
+_HTML_HEADER = sys.intern(_HTML_HEADER)
+_HTML_FOOTER = sys.intern(_HTML_FOOTER)
+_PAGE_OPEN = sys.intern(_PAGE_OPEN)
+_PAGE_CLOSE = sys.intern(_PAGE_CLOSE)
+
+# Most recently rendered PDFs kept per converter; retries on the same
+# input (common in the GUI) skip the render entirely.
+_PDF_CACHE_MAX = 32
+
+# Sanitized-and-wrapped documents kept per converter, keyed on the raw
+# input; repeat conversions skip the whole regex pipeline.
+_PREP_CACHE_MAX = 32
+
+# Below this page count the table fixups run serially; worker startup
+# costs more than the regex work for small batches.
+_PARALLEL_PAGE_THRESHOLD = 8
+
+
+def _structural_clean_lxml(html_content: str) -> str:
+    """Drop <style> blocks and empty paragraphs, collapse <br> runs,
+    rewrite <ol type=...> into inline CSS and strip hand-typed item
+    markers, all by mutating the parsed tree (lxml fast path).
+
+    The regex equivalents still exist and act as the fallback when
+    lxml is not installed.
+    """
+    if not html_content.strip():
+        # fromstring raises ParserError on empty documents, which
+        # zero-length files and empty uploads legitimately produce.
+        return html_content
+    tree = _lxml_html.fromstring(html_content)
+    for el in list(tree.iter('style')):
+        el.drop_tree()
+    for p in list(tree.iter('p')):
+        if len(p) == 0 and not (p.text or '').strip():
+            p.drop_tree()
+    for br in list(tree.iter('br')):
+        if br.getparent() is None:
+            continue
+        nxt = br.getnext()
+        while (nxt is not None and nxt.tag == 'br'
+               and not (br.tail or '').strip()):
+            br.tail = nxt.tail
+            br.getparent().remove(nxt)
+            nxt = br.getnext()
+    for ol in tree.iter('ol'):
+        ol_type = ol.attrib.pop('type', None)
+        if ol_type is not None:
+            css_style = _OL_TYPE_MAP.get(ol_type, 'decimal')
+            style = ol.attrib.get('style', '')
+            if style and not style.endswith(';'):
+                style += ';'
+            ol.attrib['style'] = f'{style}list-style-type:{css_style};'
+    for li in tree.iter('li'):
+        if li.text:
+            li.text = _LI_TEXT_MARKER_RE.sub('', li.text, count=1)
+    return _lxml_html.tostring(tree, encoding='unicode')
+
+
+def _fix_page(page: str) -> str:
+    """Table fixups applied to one page before combining.
+
+    Top-level (not a method) so it can be pickled for the process pool.
+    """
+    if "<table" in page:
+        if 'colspan=' in page or 'rowspan=' in page:
+            # xhtml2pdf mangles spanned cells in fixed layouts.
+            page = _SPAN_STRIP_RE.sub('', page)
+        page = _TABLE_TAG_RE.sub(_table_tag_repl, page)
+    return page
+
+
+def fix_list_styles(html_content: str) -> str:
+    """Convert <ol type=...> attributes into inline list-style-type CSS."""
+
+    def replace_ol_type(match: re.Match) -> str:
+        ol_type = match.group(2)
+        css_style = _OL_TYPE_MAP.get(ol_type, 'decimal')
+        # Attributes on either side of type= are kept; only type=
+        # itself is dropped.
+        attrs = (match.group(1).rstrip() + ' '
+                 + match.group(3).strip()).rstrip()
+        if 'style=' in attrs:
+            attrs = _INLINE_STYLE_RE.sub(
+                lambda m: f'style="{m.group(1)};list-style-type:{css_style};"',
+                attrs)
+            return f'<ol{attrs}>'
+        return f'<ol{attrs} style="list-style-type:{css_style};">'
+
+    return _OL_TYPE_RE.sub(replace_ol_type, html_content)
+
+
+def remove_duplicate_list_markers(html_content: str) -> str:
+    """Strip hand-typed markers ("1.", "a)", "(iv)") from <li> items so
+    they don't double up with the list's own numbering.
+
+    A single depth-tracking scan over the open/close list tags finds
+    the top-level list spans; the marker strips then run only on
+    those spans.  Unlike the old lazy .*? DOTALL regex this cannot
+    backtrack and handles lists nested inside other lists.
+    """
+
+    pieces = []
+    pos = 0
+    depth = 0
+    span_start = 0
+    for m in _LIST_TAG_RE.finditer(html_content):
+        if not m.group(1):
+            if depth == 0:
+                span_start = m.start()
+                pieces.append(html_content[pos:span_start])
+                # Keep pos in step so an unclosed list does not re-emit
+                # this prefix in the final tail append.
+                pos = span_start
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                end = html_content.find('>', m.end())
+                end = end + 1 if end != -1 else len(html_content)
+                block = _LI_MARKER_RE.sub(
+                    '<li>', html_content[span_start:end])
+                pieces.append(block)
+                pos = end
+    if not pieces:
+        return html_content
+    pieces.append(html_content[pos:])
+    return "".join(pieces)
+
+
+def sanitize_css_values(html_content: str) -> str:
+    """Clean up CSS values and markup that xhtml2pdf cannot handle."""
+    if _lxml_html is not None:
+        html_content = _structural_clean_lxml(html_content)
+    if _strip_page_numbers is not None:
+        # The typed walker handles the common \d+/\d+ strips at C
+        # speed; the fused scan's group stays as a no-op fallback.
+        html_content = _strip_page_numbers(html_content)
+    # Almost every inter-tag gap is a lone newline or space; clearing
+    # those with C-level replaces leaves the scan's tag_ws branch only
+    # the rare multi-character runs.
+    html_content = html_content.replace('>\n<', '><').replace('> <', '><')
+    html_content = _SCAN_RE.sub(_scan_repl, html_content)
+    if _lxml_html is None:
+        # Regex fallback for the list rewrites the tree pass does;
+        # a C-speed substring test gates each stage.
+        if '<ol' in html_content and 'type=' in html_content:
+            html_content = fix_list_styles(html_content)
+        if '<ol' in html_content or '<ul' in html_content:
+            html_content = remove_duplicate_list_markers(html_content)
+    return html_content
+
+
+def combine_html_pages(html_pages: list[str]) -> str:
+    """Wrap pages in a printable HTML document with the shared stylesheet."""
+    if _wrap_pages is not None:
+        return _HTML_HEADER + _wrap_pages(html_pages) + _HTML_FOOTER
+    return _HTML_HEADER + "".join(
+        _PAGE_OPEN + page + _PAGE_CLOSE
+        for page in html_pages) + _HTML_FOOTER
+
+
+def _wrap_single(page: str) -> str:
+    """Single-page fast path for combine_html_pages: plain
+    concatenation of the precomputed constants, no buffer or loop."""
+    return _HTML_HEADER + _PAGE_OPEN + page + _PAGE_CLOSE + _HTML_FOOTER
+
+
+_FONT_DIR = '/usr/share/fonts/truetype/liberation'
+_fonts_registered = False
+
+
+def _register_fonts() -> None:
+    """Register the Liberation faces with reportlab once per process.
+
+    With @font-face url() declarations pisa re-reads the TTF files on
+    every document run; fonts registered through pdfmetrics come out
+    of reportlab's cache instead.
+    """
+    global _fonts_registered
+    if _fonts_registered:
+        return
+    _fonts_registered = True
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    faces = [
+        ('Liberation Sans', 'LiberationSans-Regular.ttf'),
+        ('Liberation Sans-Bold', 'LiberationSans-Bold.ttf'),
+        ('Liberation Sans-Italic', 'LiberationSans-Italic.ttf'),
+        ('Liberation Sans-BoldItalic', 'LiberationSans-BoldItalic.ttf'),
+    ]
+    registered = 0
+    for name, filename in faces:
+        path = os.path.join(_FONT_DIR, filename)
+        if os.path.exists(path):
+            pdfmetrics.registerFont(TTFont(name, path))
+            registered += 1
+    if registered == len(faces):
+        pdfmetrics.registerFontFamily(
+            'Liberation Sans',
+            normal='Liberation Sans',
+            bold='Liberation Sans-Bold',
+            italic='Liberation Sans-Italic',
+            boldItalic='Liberation Sans-BoldItalic')
+
+
+class Xhtml2pdfEngine:
+    """Default backend: xhtml2pdf's pisa (pure Python, no extra deps).
+
+    The import happens here rather than at module load: pulling in
+    xhtml2pdf drags reportlab, PIL and html5lib along, which would
+    stall GUI startup by a second or more.
+    """
+
+    def __init__(self):
+        from xhtml2pdf import pisa
+        self._pisa = pisa
+        _register_fonts()
+
+    def render(self, html: str, dest) -> None:
+        # Encode once here; handing pisa a str makes it re-encode the
+        # whole document internally.
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        pisa_status = self._pisa.CreatePDF(BytesIO(html), dest=dest,
+                                           encoding='utf-8')
+        if pisa_status.err:
+            raise RuntimeError(
+                f"PDF generation failed with {pisa_status.err} error(s)")
+
+
+class WeasyPrintEngine:
+    """WeasyPrint backend; much faster than xhtml2pdf on table-heavy
+    documents.  Requires the weasyprint package."""
+
+    def __init__(self):
+        from weasyprint import HTML
+        self._html_cls = HTML
+
+    def render(self, html: str, dest) -> None:
+        dest.write(self._html_cls(string=html).write_pdf())
+
+
+class WkhtmltopdfEngine:
+    """wkhtmltopdf via pdfkit; a native engine that is typically 2-10x
+    faster than pisa on documents that make it crawl.  Requires the
+    pdfkit package and a wkhtmltopdf binary on PATH."""
+
+    def __init__(self):
+        import pdfkit
+        self._pdfkit = pdfkit
+
+    def render(self, html: str, dest) -> None:
+        dest.write(self._pdfkit.from_string(html, False))
+
+
+class PlaywrightEngine:
+    """Headless-Chromium backend.  The browser is launched once per
+    converter and the page reused, so startup cost is paid a single
+    time per session.  Requires the playwright package."""
+
+    def __init__(self):
+        from playwright.sync_api import sync_playwright
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch()
+        self._page = self._browser.new_context().new_page()
+
+    def render(self, html: str, dest) -> None:
+        self._page.set_content(html)
+        dest.write(self._page.pdf())
+
+    def close(self) -> None:
+        self._browser.close()
+        self._playwright.stop()
+
+
+class HTMLToPDFConverter:
+    """Converts HTML content or files to PDF.
+
+    backend selects the rendering engine: 'xhtml2pdf' (default),
+    'weasyprint' or 'playwright'.
+    """
+
+    def __init__(self, backend: str = 'xhtml2pdf'):
+        if backend == 'xhtml2pdf':
+            self._engine = Xhtml2pdfEngine()
+        elif backend == 'weasyprint':
+            self._engine = WeasyPrintEngine()
+        elif backend == 'wkhtmltopdf':
+            self._engine = WkhtmltopdfEngine()
+        elif backend == 'playwright':
+            self._engine = PlaywrightEngine()
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        self._pdf_cache = OrderedDict()
+        self._prep_cache = OrderedDict()
+
+    def close(self) -> None:
+        """Release backend resources (needed for the playwright backend)."""
+        if hasattr(self._engine, 'close'):
+            self._engine.close()
+
+    def clear_cache(self) -> None:
+        """Drop the cached prepared documents and rendered PDFs."""
+        self._prep_cache.clear()
+        self._pdf_cache.clear()
+
+    # The string pipeline is pure, so the public methods bind the
+    # module-level functions directly; hot internal call sites use the
+    # functions themselves and skip descriptor lookup and self binding.
+    sanitize_css_values = staticmethod(sanitize_css_values)
+    fix_list_styles = staticmethod(fix_list_styles)
+    remove_duplicate_list_markers = staticmethod(remove_duplicate_list_markers)
+    combine_html_pages = staticmethod(combine_html_pages)
+
+    def _prepare(self, html_content: str) -> str:
+        """Sanitize and wrap one document, with an LRU on the raw input.
+
+        Hits skip the whole regex pipeline, which matters for batch
+        retries and iterative layout tuning on the same source.
+        """
+        key = hashlib.blake2b(html_content.encode('utf-8'),
+                              digest_size=16).digest()
+        prepared = self._prep_cache.get(key)
+        if prepared is None:
+            prepared = _wrap_single(sanitize_css_values(html_content))
+            self._prep_cache[key] = prepared
+            if len(self._prep_cache) > _PREP_CACHE_MAX:
+                self._prep_cache.popitem(last=False)
+        else:
+            self._prep_cache.move_to_end(key)
+        return prepared
+
+    def _render(self, full_html: str) -> bytes:
+        """Render a complete, already-wrapped HTML document to PDF bytes."""
+        pdf_output = BytesIO()
+        self._engine.render(full_html, pdf_output)
+        return pdf_output.getvalue()
+
+    def create_pdf_from_html(self, html_content: str,
+                             output_path: str | None = None,
+                             dest=None) -> bytes | None:
+        """Sanitize and render HTML to PDF bytes; optionally save to a file.
+
+        When ``dest`` (a binary file-like) is given, the engine writes
+        straight into it and None is returned -- the PDF never exists
+        as a whole in memory. Cache hits still serve ``dest`` from the
+        cached bytes, but streamed renders are not added to the cache.
+        """
+        full_html = self._prepare(html_content)
+        # Hash the prepared document so cosmetic whitespace differences
+        # in the input still hit the cache.
+        key = hashlib.blake2b(full_html.encode('utf-8'),
+                              digest_size=16).digest()
+        pdf_bytes = self._pdf_cache.get(key)
+        if pdf_bytes is not None:
+            self._pdf_cache.move_to_end(key)
+            if dest is not None:
+                dest.write(pdf_bytes)
+                return None
+        else:
+            if dest is not None:
+                self._engine.render(full_html, dest)
+                return None
+            pdf_bytes = self._render(full_html)
+            self._pdf_cache[key] = pdf_bytes
+            if len(self._pdf_cache) > _PDF_CACHE_MAX:
+                self._pdf_cache.popitem(last=False)
+        if output_path:
+            # write_bytes issues a single write call for the buffer.
+            Path(output_path).write_bytes(pdf_bytes)
+            logger.info("PDF saved to %s", output_path)
+        return pdf_bytes
+
+    def create_pdf_from_html_to(self, html_content: str, dest) -> None:
+        """Render HTML straight into a writable binary stream.
+
+        Named entry point for the streaming path: no BytesIO is
+        materialized and no PDF-sized bytes object is returned.
+        """
+        self.create_pdf_from_html(html_content, dest=dest)
+
+    def convert_html_file_to_pdf(self, html_file_path: str,
+                                 output_pdf_path: str,
+                                 save_processed_html: bool = False) -> None:
+        """Convert a single HTML file to a PDF file."""
+        with open(html_file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                # Decode straight out of the page cache; large exports
+                # skip the intermediate bytes copy a plain read() makes.
+                with mmap.mmap(f.fileno(), 0,
+                               access=mmap.ACCESS_READ) as mm:
+                    html_content = str(mm, 'utf-8')
+            else:
+                html_content = ''
+        with open(output_pdf_path, 'wb') as f:
+            self.create_pdf_from_html_to(html_content, f)
+        if save_processed_html:
+            # The render above already prepared this document, so this
+            # is a cache hit, not a second trip through the pipeline.
+            processed = self._prepare(html_content)
+            processed_path = output_pdf_path.replace('.pdf', '_processed.html')
+            with open(processed_path, 'w', encoding='utf-8') as f:
+                f.write(processed)
+        logger.info("Converted %s -> %s", html_file_path, output_pdf_path)
+
+    def convert_html_pages_to_pdf(self, html_pages: list[str],
+                                  output_pdf_path: str,
+                                  save_processed_html: bool = False) -> None:
+        """Convert a list of HTML page fragments into one multi-page PDF."""
+        if len(html_pages) >= _PARALLEL_PAGE_THRESHOLD:
+            # The per-page fixups are independent and CPU-bound, so
+            # large batches fan out over cores.
+            chunksize = max(1, len(html_pages) // ((os.cpu_count() or 1) * 4))
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                fixed_pages = list(executor.map(_fix_page, html_pages,
+                                                chunksize=chunksize))
+        else:
+            fixed_pages = [_fix_page(page) for page in html_pages]
+        # Sanitize per page, wrap once, render once.  Routing the
+        # combined document back through create_pdf_from_html would
+        # re-run the sanitizer on it and strip the wrapper's own
+        # <style> block.
+        combined = combine_html_pages(
+            [sanitize_css_values(page) for page in fixed_pages])
+        # Render straight into the output file; buffering the PDF in a
+        # BytesIO and copying it out would hold two copies in memory.
+        with open(output_pdf_path, 'wb') as f:
+            self._engine.render(combined, f)
+        if save_processed_html:
+            processed_path = output_pdf_path.replace('.pdf', '_processed.html')
+            with open(processed_path, 'w', encoding='utf-8') as f:
+                f.write(combined)
+        logger.info("Converted %d page(s) -> %s",
+                    len(html_pages), output_pdf_path)
+
+
+# Per-process converter for convert_many; the pool initializer builds
+# it once so each worker imports the engine a single time.
+_worker_converter = None
+
+
+def _pool_init(backend: str) -> None:
+    global _worker_converter
+    _worker_converter = HTMLToPDFConverter(backend)
+
+
+def _pool_convert(pair: tuple[str, str]) -> str:
+    html_path, pdf_path = pair
+    _worker_converter.convert_html_file_to_pdf(html_path, pdf_path)
+    return pdf_path
+
+
+def warmup(backend: str = 'xhtml2pdf') -> HTMLToPDFConverter:
+    """Heat the engine's lazy caches with a throwaway render.
+
+    reportlab builds its font and CSS state on first use, so the first
+    conversion in a fresh process pays a few hundred milliseconds of
+    one-time setup; rendering a stub page up front moves that cost to
+    startup.  Returns the warmed converter so callers can keep it.
+    """
+    converter = HTMLToPDFConverter(backend)
+    converter.create_pdf_from_html('<p>warmup</p>')
+    converter.clear_cache()
+    return converter
+
+
+def convert_many(pairs: list[tuple[str, str]],
+                 workers: int | None = None,
+                 backend: str = 'xhtml2pdf') -> None:
+    """Convert (html_path, pdf_path) pairs in parallel across cores.
+
+    pisa is pure Python and CPU-bound, and the documents are
+    independent, so batch conversion scales close to linearly with
+    worker processes.
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_pool_init, initargs=(backend,)) as executor:
+        for _ in executor.map(_pool_convert, pairs):
+            pass
+
+
+def main() -> None:
+    # The library logs through the module logger; give CLI runs a
+    # handler so progress still shows (root default is WARNING).
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    parser = argparse.ArgumentParser(
+        description='Convert HTML files to PDF.')
+    parser.add_argument('inputs', nargs='+', help='HTML file(s) to convert')
+    parser.add_argument('-o', '--output',
+                        help='output PDF path (single input only)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes for multiple inputs '
+                             '(default: CPU count)')
+    parser.add_argument('-b', '--backend', default='xhtml2pdf',
+                        choices=['xhtml2pdf', 'weasyprint', 'wkhtmltopdf',
+                                 'playwright'],
+                        help='rendering engine (default: xhtml2pdf)')
+    args = parser.parse_args()
+    if args.output and len(args.inputs) == 1:
+        pairs = [(args.inputs[0], args.output)]
+    else:
+        pairs = [(path, os.path.splitext(path)[0] + '.pdf')
+                 for path in args.inputs]
+    if len(pairs) == 1:
+        converter = HTMLToPDFConverter(args.backend)
+        converter.convert_html_file_to_pdf(*pairs[0])
+    else:
+        convert_many(pairs, workers=args.jobs, backend=args.backend)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+"""Build script for the optional Cython extension.
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='html-to-pdf-conversion',
+    ext_modules=cythonize('html_to_pdf_fast.pyx', language_level=3),
+)
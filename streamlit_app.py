@@ -0,0 +1,44 @@
+"""Streamlit front end for the HTML to PDF converter."""
+
+import os
+
+import streamlit as st
+
+from html_to_pdf_standalone import HTMLToPDFConverter, warmup
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_pdf(html_bytes: bytes) -> bytes:
+    """Render uploaded HTML to PDF, memoized across script re-runs.
+
+    Streamlit re-executes the whole script on every widget change;
+    caching on the upload bytes means only genuinely new HTML pays for
+    the sanitize + render pipeline.
+    """
+    return HTMLToPDFConverter().create_pdf_from_html(
+        html_bytes.decode('utf-8'))
+
+
+def main():
+    st.title("HTML to PDF Converter")
+    st.write("Upload an HTML file and convert it to a printable PDF.")
+
+    if 'warmed' not in st.session_state:
+        # Pay reportlab's one-time font/CSS setup at startup instead
+        # of on the user's first conversion.
+        warmup()
+        st.session_state['warmed'] = True
+
+    uploaded_file = st.file_uploader("Upload HTML", type=['html', 'htm'])
+    if uploaded_file is not None and st.button("Convert"):
+        with st.spinner("Converting..."):
+            pdf_bytes = _cached_pdf(uploaded_file.getvalue())
+        st.success("Conversion complete.")
+        st.download_button(
+            "Download PDF", data=pdf_bytes,
+            file_name=os.path.splitext(uploaded_file.name)[0] + '.pdf',
+            mime='application/pdf')
+
+
+if __name__ == '__main__':
+    main()
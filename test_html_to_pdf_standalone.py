@@ -0,0 +1,137 @@
+"""Tests for the string pipeline in html_to_pdf_standalone.
+
+Only the pure string functions are exercised; nothing here needs
+xhtml2pdf or a rendering backend installed.
+
+    python -m unittest test_html_to_pdf_standalone
+"""
+
+import unittest
+
+from html_to_pdf_standalone import (
+    _HTML_FOOTER,
+    _HTML_HEADER,
+    _fix_page,
+    combine_html_pages,
+    fix_list_styles,
+    remove_duplicate_list_markers,
+    sanitize_css_values,
+)
+
+
+class SanitizeCssValuesTest(unittest.TestCase):
+
+    def test_legal_references_are_preserved(self):
+        html = ('<p>See paragraph 1.1 and (paragraph 4.1); '
+                'per 3.1 of this article.</p>')
+        out = sanitize_css_values(html)
+        self.assertIn('paragraph 1.1', out)
+        self.assertIn('(paragraph 4.1)', out)
+        self.assertIn('3.1 of this article', out)
+
+    def test_multi_digit_fraction_references_are_preserved(self):
+        # The engine must not backtrack "3.15" down to "3.1" to get
+        # around the of-this guard.
+        out = sanitize_css_values('<p>see 3.15 of this article</p>')
+        self.assertIn('3.15 of this article', out)
+
+    def test_bare_decimals_are_stripped(self):
+        self.assertEqual(sanitize_css_values('<p>ratio 2.5 here</p>'),
+                         '<p>ratio 2 here</p>')
+        self.assertEqual(sanitize_css_values('<p>ratio 2.55 here</p>'),
+                         '<p>ratio 2 here</p>')
+
+    def test_css_unit_decimals_are_rounded_down(self):
+        out = sanitize_css_values(
+            '<p style="font-size: 10.5pt; width: 33.3%; height: 2.5em;">x</p>')
+        self.assertIn('10pt', out)
+        self.assertIn('33%', out)
+        self.assertIn('2em', out)
+
+    def test_padding_and_margin_are_normalized(self):
+        out = sanitize_css_values(
+            '<p style="padding: 12px; margin: 9px; margin-top: 3px;">x</p>')
+        self.assertIn('padding:6px;', out)
+        self.assertIn('margin:0;', out)
+        self.assertIn('margin-top:6px;', out)
+
+    def test_style_blocks_and_page_numbers_are_removed(self):
+        out = sanitize_css_values(
+            '<style>body { color: red; }</style><p>Page 3/12</p><p>4/12</p>')
+        self.assertNotIn('<style', out)
+        self.assertNotIn('3/12', out)
+        self.assertNotIn('4/12', out)
+
+    def test_br_runs_collapse_to_one(self):
+        out = sanitize_css_values('<p>a</p><br><br><br><p>b</p>')
+        self.assertEqual(out.count('<br>'), 1)
+
+
+class ListMarkerTest(unittest.TestCase):
+
+    def test_hand_typed_markers_are_stripped(self):
+        html = ('<ol><li>1. one</li><li>a) two</li>'
+                '<li>(iv) three</li><li>ii. four</li></ol>')
+        self.assertEqual(
+            remove_duplicate_list_markers(html),
+            '<ol><li>one</li><li>two</li><li>three</li><li>four</li></ol>')
+
+    def test_nested_lists_are_handled(self):
+        html = '<ol><li>1. a<ul><li>2. b</li></ul></li></ol>'
+        self.assertEqual(
+            remove_duplicate_list_markers(html),
+            '<ol><li>a<ul><li>b</li></ul></li></ol>')
+
+    def test_unclosed_list_does_not_duplicate_prefix(self):
+        html = 'prefix text <ul><li>1. x'
+        self.assertEqual(remove_duplicate_list_markers(html), html)
+
+    def test_text_without_lists_is_untouched(self):
+        self.assertEqual(remove_duplicate_list_markers('<p>1. x</p>'),
+                         '<p>1. x</p>')
+
+    def test_ol_type_becomes_inline_css(self):
+        self.assertEqual(
+            fix_list_styles('<ol type="a"><li>x</li></ol>'),
+            '<ol style="list-style-type:lower-alpha;"><li>x</li></ol>')
+
+    def test_ol_type_merges_with_existing_style(self):
+        out = fix_list_styles('<ol type="I" style="color:blue"><li>x</li></ol>')
+        self.assertIn('color:blue;list-style-type:upper-roman;', out)
+        self.assertEqual(out.count('style='), 1)
+
+    def test_ol_style_before_type_is_preserved(self):
+        out = fix_list_styles('<ol style="color:red" type="a"><li>x</li></ol>')
+        self.assertIn('color:red;list-style-type:lower-alpha;', out)
+        self.assertEqual(out.count('style='), 1)
+
+
+class FixPageTest(unittest.TestCase):
+
+    def test_spans_are_stripped_and_styles_injected(self):
+        out = _fix_page('<table colspan="2"><td rowspan="3">x</td></table>')
+        self.assertNotIn('colspan', out)
+        self.assertNotIn('rowspan', out)
+        self.assertIn('<table style="table-layout:fixed;width:100%;">', out)
+        self.assertIn('<td style="width:auto;">', out)
+
+    def test_existing_style_attributes_are_merged(self):
+        out = _fix_page('<table style="color:red"><td>x</td></table>')
+        self.assertIn('style="color:red;table-layout:fixed;width:100%;"', out)
+        self.assertEqual(out.count('style='), 2)  # one per tag, not two
+
+    def test_pages_without_tables_pass_through(self):
+        self.assertEqual(_fix_page('<p>no tables</p>'), '<p>no tables</p>')
+
+
+class CombineHtmlPagesTest(unittest.TestCase):
+
+    def test_pages_are_wrapped_in_page_divs(self):
+        combined = combine_html_pages(['<p>one</p>', '<p>two</p>'])
+        self.assertTrue(combined.startswith(_HTML_HEADER))
+        self.assertTrue(combined.endswith(_HTML_FOOTER))
+        self.assertEqual(combined.count('class="page"'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()